@@ -29,6 +29,8 @@ Requirements:
     - Selenium WebDriver
     - Chrome/Chromium browser
     - BeautifulSoup4
+    - lxml
+    - requests (optional, for fetching pages without a browser render)
 
 Author: AI Assistant
 Version: 2.1
@@ -40,8 +42,11 @@ import os
 import time
 import random
 import re
+import io
 import argparse
-from bs4 import BeautifulSoup
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
 
 # Selenium imports
 try:
@@ -58,11 +63,547 @@ except ImportError:
     print("Install with: pip install selenium")
     sys.exit(1)
 
+# Optional HTTP client for fetching pages without a browser render
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+
+def _is_article_tag(name, attrs):
+    """Strainer filter keeping only the page title, top-level headings, article header and sections"""
+    return name in ('title', 'h1') or attrs.get('data-e2e-test-id') in ('articleHeader', 'section-with-header')
+
+
+def _child_tags(element, names):
+    """Direct children of element whose tag name is in names, in document order"""
+    return [child for child in element.children if child.name in names]
+
+
+def _split_list_item(li, clean, li_text_parts):
+    """
+    Return the cleaned text of an li outside its nested list, and that nested ul
+    
+    li_text_parts is a scratch list owned by the caller, cleared here, so a
+    walk over many items reuses one buffer.
+    """
+    li_text_parts.clear()
+    nested_ul = None
+    for child in li.children:
+        if hasattr(child, 'name') and child.name == 'ul':
+            nested_ul = child
+            break  # Stop when we hit nested ul
+        elif hasattr(child, 'get_text'):
+            text = clean(child.get_text())
+            if text:
+                li_text_parts.append(text)
+        elif isinstance(child, str) and child.strip():
+            cleaned = clean(child)
+            if cleaned:
+                li_text_parts.append(cleaned)
+    
+    return " ".join(li_text_parts).strip(), nested_ul
+
+
+def _process_table_li(li_element, out, clean, bullet="•", indent=""):
+    """Append a table-cell list item and its nested items to out as bullet lines"""
+    # Work stack of (li, bullet, indent), popped in document order
+    stack = [(li_element, bullet, indent)]
+    li_text_parts = []
+    while stack:
+        li, bullet_char, item_indent = stack.pop()
+        li_text, nested_ul = _split_list_item(li, clean, li_text_parts)
+        if li_text:
+            out.append(f"{item_indent}{bullet_char} {li_text}")
+        
+        if nested_ul is not None:
+            stack.extend((nested_li, "◦", "&nbsp;&nbsp;&nbsp;&nbsp;")
+                         for nested_li in reversed(_child_tags(nested_ul, ('li',))))
+
+
+# format_table_cell handlers, one per tag name of interest. Each receives the
+# descendant, the number of lists enclosing it and clean_text, and returns the
+# fragment to append (or None)
+def _cell_br(element, list_depth, clean):
+    return '<br/>'
+
+
+def _cell_list(element, list_depth, clean):
+    # Items of a list nested in another one get the indented bullet
+    bullet = "&nbsp;&nbsp;&nbsp;&nbsp;◦" if list_depth else "•"
+    items = []
+    for li in _child_tags(element, ('li',)):
+        li_text = clean(li.get_text())
+        if li_text:
+            items.append(f"{bullet} {li_text}")
+    return ' '.join(items) or None
+
+
+def _cell_bold(element, list_depth, clean):
+    text = clean(element.get_text())
+    return f"**{text}**" if text else None
+
+
+def _cell_em(element, list_depth, clean):
+    text = clean(element.get_text())
+    return f"*{text}*" if text else None
+
+
+_CELL_TAG_HANDLERS = {
+    'br': _cell_br,
+    'ul': _cell_list,
+    'ol': _cell_list,
+    'strong': _cell_bold,
+    'b': _cell_bold,
+    'em': _cell_em,
+    'i': _cell_em,
+}
+_CELL_FORMATTED_TAGS = list(_CELL_TAG_HANDLERS)
+# Handlers still applied below an emitted element; any other text there is
+# already part of its fragment
+_CELL_NESTED_TAG_HANDLERS = {
+    name: _CELL_TAG_HANDLERS[name] for name in ('br', 'ul', 'ol')
+}
+
+
+# Restricts tree construction to the parts of the page that extraction reads
+ARTICLE_STRAINER = SoupStrainer(_is_article_tag)
+
+# Matches the CSS-module class of the container wrapping a section's body
+_BASE_STYLES_RE = re.compile(r'baseStyles')
+
+# Whitespace runs collapsed by clean_text, and the non-whitespace control
+# characters (plus DEL) it deletes outright
+_WS_RE = re.compile(r'\s+')
+_CTRL_TABLE = dict.fromkeys(
+    [c for c in range(32) if not chr(c).isspace()] + [127]
+)
+
+# Reference markers like [1] or [2][3] and UI labels that leak into text, both
+# stripped by clean_text in a single pass
+_UNWANTED_STRINGS = ["Maximize table", "Table Quiz", "Collapse", "Notes", "Feedback"]
+_CLEANUP_RE = re.compile(r'\[\d+\](?:\[\d+\])*|' + '|'.join(map(re.escape, _UNWANTED_STRINGS)))
+
+# Filename sanitizing: characters dropped from titles and characters replaced
+# in URL-derived names
+_FILENAME_INVALID_RE = re.compile(r'[^\w\s-]')
+_URL_SLUG_INVALID_RE = re.compile(r'[^a-zA-Z0-9_-]')
+
+# The same substitutions as str.translate tables for ASCII input (the common
+# case), derived from the patterns above so both paths agree
+_FILENAME_INVALID_TABLE = dict.fromkeys(c for c in range(128) if _FILENAME_INVALID_RE.match(chr(c)))
+_URL_SLUG_INVALID_TABLE = {c: '_' for c in range(128) if _URL_SLUG_INVALID_RE.match(chr(c))}
+
+
+def _strip_filename_chars(title):
+    """Drop the characters of title that may not appear in a filename"""
+    if title.isascii():
+        return title.translate(_FILENAME_INVALID_TABLE)
+    return _FILENAME_INVALID_RE.sub('', title)
+
+
+def _url_slug(name):
+    """Replace everything but ASCII letters, digits, '_' and '-' in name with '_'"""
+    if name.isascii():
+        return name.translate(_URL_SLUG_INVALID_TABLE)
+    return _URL_SLUG_INVALID_RE.sub('_', name)
+
+# Titles of sections that are never exported
+_REFERENCES_RE = re.compile(r'references', re.I)
+
+# Section heading inside the particle header, resolved in one compiled CSS query
+_PARTICLE_HEADER_TITLE_SELECTOR = 'div[data-e2e-test-id="particle-header"] h3'
+
+# Case-insensitive class matchers used when hunting for section titles
+_HEADER_CLS_RE = re.compile(r'header', re.I)
+_HEADER_TITLE_CLS_RE = re.compile(r'header|title', re.I)
+_HEADER_BTN_CLS_RE = re.compile(r'header|title|button', re.I)
+_TITLE_CLS_RE = re.compile(r'title', re.I)
+
+# Site suffix trimmed from <title> text
+_AMBOSS_TITLE_SUFFIX = ' - AMBOSS'
+
+# Requests dropped at the network layer in light mode: analytics, trackers,
+# chat widgets, and image/font assets the text extraction never reads
+BLOCKED_URL_PATTERNS = [
+    '*google-analytics*',
+    '*googletagmanager*',
+    '*doubleclick*',
+    '*segment.io*',
+    '*hotjar*',
+    '*facebook.net*',
+    '*intercom*',
+    '*.png',
+    '*.jpg',
+    '*.jpeg',
+    '*.gif',
+    '*.svg',
+    '*.woff*',
+    '*.ttf'
+]
+
+# Print and screen stylesheet embedded in every standalone HTML export
+_HTML_CSS = """\
+        /* Print-friendly styles */
+        @media print {
+            body { 
+                font-family: 'Times New Roman', serif;
+                font-size: 12pt;
+                line-height: 1.4;
+                margin: 0.5in;
+                color: black;
+            }
+            
+            /* Section-level styling */
+            .section {
+                margin-bottom: 20pt;
+            }
+            
+            /* Main section titles (h2) */
+            .section-title {
+                font-size: 16pt;
+                font-weight: bold;
+                margin-top: 24pt;
+                margin-bottom: 12pt;
+                border-bottom: 2pt solid #333;
+                padding-bottom: 6pt;
+            }
+            
+            /* Subsection titles (h3) */
+            h3 {
+                font-size: 14pt;
+                font-weight: bold;
+                margin-top: 18pt;
+                margin-bottom: 8pt;
+            }
+            
+            /* Sub-subsection titles (h4) */
+            h4 {
+                font-size: 13pt;
+                font-weight: bold;
+                margin-top: 14pt;
+                margin-bottom: 6pt;
+            }
+            
+            /* Content boxes */
+            .content-box {
+                border: 1pt solid #666;
+                padding: 8pt;
+                margin: 12pt 0;
+                background-color: #f9f9f9;
+            }
+            .note { border-left: 4pt solid #4CAF50; }
+            .warning { border-left: 4pt solid #f44336; }
+            .tip { border-left: 4pt solid #2196F3; }
+            .important { border-left: 4pt solid #FF9800; }
+            
+            /* Tables */
+            table {
+                border-collapse: collapse;
+                width: 100%;
+                margin: 12pt 0;
+            }
+            th, td {
+                border: 1pt solid #333;
+                padding: 6pt;
+                text-align: left;
+                vertical-align: top;
+            }
+            th {
+                background-color: #f0f0f0;
+                font-weight: bold;
+            }
+            
+            /* Images */
+            img {
+                max-width: 100%;
+                height: auto;
+                display: block;
+                margin: 12pt auto;
+            }
+            
+            /* Image containers */
+            .image-container {
+                margin: 12pt 0;
+            }
+            
+            /* Lists */
+            ul, ol {
+                margin: 8pt 0;
+                padding-left: 20pt;
+            }
+            
+            /* Individual list items */
+            li {
+                margin: 4pt 0;
+            }
+            
+            /* Nested lists */
+            ul ul, ol ol, ul ol, ol ul {
+                margin: 4pt 0;
+            }
+            
+            /* Paragraphs */
+            p {
+                margin: 8pt 0;
+            }
+        }
+
+        /* Screen styles */
+        @media screen {
+            body {
+                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+                max-width: 800px;
+                margin: 0 auto;
+                padding: 20px;
+                line-height: 1.6;
+                background-color: #fff;
+            }
+            .section {
+                margin-bottom: 30px;
+                padding: 20px;
+                border-radius: 8px;
+                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+            }
+            .section-title {
+                font-size: 24px;
+                font-weight: bold;
+                margin-bottom: 15px;
+                color: #333;
+                border-bottom: 2px solid #007acc;
+                padding-bottom: 8px;
+            }
+            .content-box {
+                border-radius: 6px;
+                padding: 15px;
+                margin: 15px 0;
+            }
+            .note { 
+                background-color: #e8f5e8; 
+                border-left: 4px solid #4CAF50; 
+            }
+            .warning { 
+                background-color: #ffeaea; 
+                border-left: 4px solid #f44336; 
+            }
+            .tip { 
+                background-color: #e3f2fd; 
+                border-left: 4px solid #2196F3; 
+            }
+            .important { 
+                background-color: #fff3e0; 
+                border-left: 4px solid #FF9800; 
+            }
+
+            table {
+                border-collapse: collapse;
+                width: 100%;
+                margin: 15px 0;
+                box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+            }
+            th, td {
+                border: 1px solid #ddd;
+                padding: 12px;
+                text-align: left;
+            }
+            th {
+                background-color: #f8f9fa;
+                font-weight: 600;
+            }
+            tr:nth-child(even) {
+                background-color: #f8f9fa;
+            }
+        }
+"""
+
+# Shared stylesheet written next to batch HTML exports, which link it instead
+# of embedding _HTML_CSS
+_HTML_STYLESHEET_NAME = 'styles.css'
+
+# parse_and_format's result for a page without article sections
+_NO_CONTENT_MESSAGE = "No content found"
+
+# Markup of a server-rendered page whose sections are all expanded; pages with
+# any collapsed container still need the browser to expand them
+_SHOWN_SECTION_MARKER = b'section-content-is-shown'
+_HIDDEN_SECTION_MARKER = b'section-content-is-hidden'
+
+# Buffer size for exported files, large enough that an article is written in
+# a single flush rather than in default-sized chunks
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Parallel HTTP page fetches in batch mode, shared by the API and --workers
+_DEFAULT_FETCH_CONCURRENCY = 5
+
+# Global expand/collapse buttons, tried in order
+_TOGGLE_SELECTORS = (
+    '[data-e2e-test-id="toggle-all-sections-button"]',
+    'button[aria-label*="toggle"]',
+    'button[aria-label*="expand"]',
+    'button[aria-label*="collapse"]',
+    '[data-testid*="toggle"]'
+)
+
+# Per-section header elements that might toggle the section open
+_HEADER_SELECTORS = (
+    '[data-e2e-test-id="section-with-header"] [role="button"]',
+    '[data-e2e-test-id="section-with-header"] button',
+    '[data-e2e-test-id="section-with-header"] h3',
+    '[data-e2e-test-id="section-with-header"] h4',
+    '[data-e2e-test-id="section-with-header"] [class*="header"]'
+)
+
+# Page areas and toggle candidates counted by _debug_page_structure
+_DEBUG_MAIN_SELECTORS = (
+    'article[data-e2e-test-id="learningCardContent"]',
+    'article',
+    'main',
+    '[data-e2e-test-id*="content"]',
+    '[data-e2e-test-id*="article"]',
+    '[data-e2e-test-id*="learning"]'
+)
+_DEBUG_TOGGLE_SELECTORS = (
+    '[data-e2e-test-id*="toggle"]',
+    'button[aria-label*="expand"]',
+    'button[aria-label*="collapse"]',
+    'button[aria-expanded]'
+)
+_DEBUG_LEARNING_CARD_SELECTORS = (
+    '[data-e2e-test-id="section-with-header"]',
+    '[data-e2e-test-id*="section-content"]'
+)
+
+# Div classes rendered as note/warning/tip boxes, and every div class the
+# content loop handles itself (skipped by the generic fallback)
+_BOX_CLASSES = frozenset({'merke', 'cave', 'content-box'})
+_HANDLED_DIV_CLASSES = frozenset({'table-wrapper', 'paragraph'}) | _BOX_CLASSES
+
+# Markup for each kind of content box, filled with the box text
+_BOX_TMPLS = {
+    'note': '<div class="content-box note">💡 **Note:** %s</div>',
+    'warning': '<div class="content-box warning">⚠️ **Warning:** %s</div>',
+    'tip': '<div class="content-box tip">📝 **Tip:** %s</div>',
+}
+
+# Centered image block emitted by extract_image_info
+_IMG_TMPL = '<div style="text-align: center; margin: 20px 0;"><img src="{src}" alt="{title}" width="400" style="max-width: 100%; height: auto;"><p><em>{title}</em></p></div>'
+
+# Polling interval (seconds) for waits that replace fixed sleeps after clicks
+_WAIT_POLL_FREQUENCY = 0.1
+# Longest such wait (seconds), the old worst-case fixed delay, so a click that
+# changes nothing costs no more than it used to
+_WAIT_TIMEOUT = 2
+
+# Serializes the page title, the article header and, per section, only its
+# heading and content container, so the browser ships a compact document with
+# exactly what extraction reads. Sections nested in another section travel
+# inside their parent's container. Without sections it falls back to the
+# learning card article, then <main>, then the whole document.
+_ARTICLE_HTML_JS = """
+var title = document.createElement('title');
+title.textContent = document.title;
+var sectionSelector = 'section[data-e2e-test-id="section-with-header"]';
+var sections = document.querySelectorAll(sectionSelector);
+if (!sections.length) {
+    var root = document.querySelector('article[data-e2e-test-id="learningCardContent"]') ||
+        document.querySelector('main') || document.documentElement;
+    return title.outerHTML + root.outerHTML;
+}
+var parts = [title.outerHTML];
+var header = document.querySelector('[data-e2e-test-id="articleHeader"]');
+if (header) {
+    parts.push(header.outerHTML);
+}
+var h1 = document.querySelector('h1');
+if (h1 && !(header && header.contains(h1)) && !h1.closest(sectionSelector)) {
+    parts.push(h1.outerHTML);
+}
+sections.forEach(function(section) {
+    if (section.parentElement && section.parentElement.closest(sectionSelector)) {
+        return;
+    }
+    var heading = section.querySelector('h3');
+    var content = section.querySelector('div[data-e2e-test-id="section-content-is-shown"]') ||
+        section.querySelector('div[data-e2e-test-id="section-content-is-hidden"]');
+    parts.push(
+        '<section data-e2e-test-id="section-with-header">' +
+        (heading ? heading.outerHTML : '') +
+        (content ? content.outerHTML : '') +
+        '</section>'
+    );
+});
+return parts.join('');
+"""
+
+# Counts expanded and still collapsed section content containers
+_COUNT_SECTION_STATES_JS = """
+return [
+    document.querySelectorAll('[data-e2e-test-id="section-content-is-shown"]').length,
+    document.querySelectorAll('[data-e2e-test-id="section-content-is-hidden"]').length
+];
+"""
+
+# Counts sections whose rendered text is longer than arguments[0] characters
+_COUNT_SECTIONS_WITH_TEXT_JS = """
+var minLength = arguments[0];
+var sections = document.querySelectorAll('[data-e2e-test-id="section-with-header"]');
+return Array.from(sections).filter(function(section) {
+    return section.innerText.trim().length > minLength;
+}).length;
+"""
+
+# Clicks collapsed aria-expanded buttons and double-clicks expanded ones so they
+# re-render; returns [total, collapsed clicked, expanded re-toggled]
+_CLICK_ARIA_EXPANDED_JS = """
+var buttons = document.querySelectorAll('button[aria-expanded]');
+var collapsed = 0, expanded = 0;
+buttons.forEach(function(button) {
+    var state = button.getAttribute('aria-expanded');
+    if (state === 'false') {
+        button.click();
+        collapsed++;
+    } else if (state === 'true') {
+        button.click();
+        button.click();
+        expanded++;
+    }
+});
+return [buttons.length, collapsed, expanded];
+"""
+
+# Clicks every visible element matching any selector in arguments[0]; returns the count
+_CLICK_VISIBLE_JS = """
+var clicked = 0;
+arguments[0].forEach(function(selector) {
+    document.querySelectorAll(selector).forEach(function(element) {
+        if (element.offsetParent !== null) {
+            element.click();
+            clicked++;
+        }
+    });
+});
+return clicked;
+"""
+
+# Counts matches for each selector in arguments[0], inside the first element
+# matching arguments[1] when given (all zeros if that element is missing)
+_COUNT_SELECTORS_JS = """
+var root = arguments[1] ? document.querySelector(arguments[1]) : document;
+return arguments[0].map(function(selector) {
+    return root ? root.querySelectorAll(selector).length : 0;
+});
+"""
+
 
 class AmbossScraper:
     """Main scraper class for AMBOSS content extraction"""
     
-    def __init__(self, username=None, password=None, debug=False):
+    def __init__(self, username=None, password=None, debug=False, light_mode=None):
         """
         Initialize the AMBOSS scraper
         
@@ -70,12 +611,17 @@ class AmbossScraper:
             username: Email for AMBOSS authentication
             password: Password for AMBOSS authentication  
             debug: Enable debug output and file saving
+            light_mode: Skip loading images and background browser features
+                (default: enabled unless debug is set)
         """
         self.username = username
         self.password = password
         self.debug = debug
+        self.light_mode = (not debug) if light_mode is None else light_mode
         self.driver = None
         self.debug_dir = None
+        self._logged_in = False
+        self._http = self._create_http_session() if REQUESTS_AVAILABLE else None
         
         # Setup debug directory if needed
         if self.debug:
@@ -89,6 +635,29 @@ class AmbossScraper:
         if self.debug:
             print(f"DEBUG: {message}")
     
+    def _save_debug_html(self, filename, html_content):
+        """Save fetched page HTML (str, or raw bytes from HTTP) in the debug directory"""
+        if isinstance(html_content, str):
+            html_content = html_content.encode('utf-8')
+        with open(f"{self.debug_dir}/{filename}", "wb") as f:
+            f.write(html_content)
+    
+    def _create_http_session(self):
+        """Create a pooled keep-alive HTTP session for plain page fetches"""
+        session = requests.Session()
+        session.headers['User-Agent'] = USER_AGENT
+        session.mount('https://', HTTPAdapter(pool_maxsize=20))
+        return session
+    
+    def _sync_http_cookies(self):
+        """Copy the browser's session cookies into the HTTP session"""
+        if not self._http or not self.driver:
+            return
+        
+        for cookie in self.driver.get_cookies():
+            self._http.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+        self._debug_print("Copied browser cookies to HTTP session")
+    
     def setup_driver(self):
         """Setup Chrome WebDriver with optimal settings"""
         if not SELENIUM_AVAILABLE:
@@ -101,18 +670,42 @@ class AmbossScraper:
             chrome_options.add_argument('--disable-dev-shm-usage')
             chrome_options.add_argument('--disable-gpu')
             chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+            chrome_options.add_argument(f'--user-agent={USER_AGENT}')
+            
+            if self.light_mode:
+                # Only the DOM is scraped, so skip image downloads and background work
+                chrome_options.add_experimental_option('prefs', {
+                    'profile.managed_default_content_settings.images': 2,
+                    'profile.default_content_setting_values.cookies': 1
+                })
+                chrome_options.add_argument('--blink-settings=imagesEnabled=false,loadsImagesAutomatically=false')
+                chrome_options.add_argument('--disable-extensions')
+                chrome_options.add_argument('--disable-background-networking')
+                chrome_options.add_argument('--disable-features=Translate,BackForwardCache')
             
             self.driver = webdriver.Chrome(options=chrome_options)
             self._debug_print("WebDriver setup successful")
+            
+            if self.light_mode:
+                self._block_unneeded_requests()
+            
             return True
         except Exception as e:
             print(f"ERROR: Could not setup WebDriver: {e}")
             print("Make sure Chrome/Chromium is installed and chromedriver is in PATH")
             return False
     
+    def _block_unneeded_requests(self):
+        """Block trackers and static assets via the Chrome DevTools Protocol"""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            self._debug_print(f"Blocking {len(BLOCKED_URL_PATTERNS)} URL patterns")
+        except Exception as e:
+            self._debug_print(f"Could not set blocked URLs: {e}")
+    
     def cleanup(self):
-        """Clean up WebDriver resources"""
+        """Clean up WebDriver and HTTP session resources"""
         if self.driver:
             try:
                 self.driver.quit()
@@ -120,6 +713,11 @@ class AmbossScraper:
             except:
                 pass
             self.driver = None
+            self._logged_in = False
+        
+        # Close pooled keep-alive connections; the session reopens them if reused
+        if self._http:
+            self._http.close()
     
     def login(self):
         """
@@ -132,6 +730,10 @@ class AmbossScraper:
             self._debug_print("No credentials provided, skipping login")
             return True
         
+        if self._logged_in and self.driver:
+            self._debug_print("Already logged in, reusing session")
+            return True
+        
         if not self.driver:
             if not self.setup_driver():
                 return False
@@ -178,6 +780,8 @@ class AmbossScraper:
                     lambda driver: 'login' not in driver.current_url.lower()
                 )
                 self._debug_print(f"Login successful - redirected to: {self.driver.current_url}")
+                self._logged_in = True
+                self._sync_http_cookies()
                 return True
             except TimeoutException:
                 if 'login' in self.driver.current_url.lower():
@@ -185,6 +789,8 @@ class AmbossScraper:
                     return False
                 else:
                     self._debug_print("Login appears successful")
+                    self._logged_in = True
+                    self._sync_http_cookies()
                     return True
                     
         except Exception as e:
@@ -233,15 +839,7 @@ class AmbossScraper:
     def _try_global_toggle_button(self):
         """Try to find and use a global toggle button"""
         try:
-            toggle_selectors = [
-                '[data-e2e-test-id="toggle-all-sections-button"]',
-                'button[aria-label*="toggle"]',
-                'button[aria-label*="expand"]',
-                'button[aria-label*="collapse"]',
-                '[data-testid*="toggle"]'
-            ]
-            
-            for selector in toggle_selectors:
+            for selector in _TOGGLE_SELECTORS:
                 try:
                     toggle_button = WebDriverWait(self.driver, 2).until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
@@ -249,8 +847,9 @@ class AmbossScraper:
                     self._debug_print(f"Found global toggle button: {selector}")
                     
                     # Click to expand (assume it will expand if collapsed)
+                    shown_before = self._count_shown_sections()
                     toggle_button.click()
-                    time.sleep(2)
+                    self._wait_for_sections_settled(shown_before)
                     
                     # Check if content appeared
                     if self._check_content_visibility():
@@ -258,8 +857,9 @@ class AmbossScraper:
                         return True
                     
                     # If no content appeared, try clicking again
+                    shown_before = self._count_shown_sections()
                     toggle_button.click()
-                    time.sleep(2)
+                    self._wait_for_sections_settled(shown_before)
                     
                     if self._check_content_visibility():
                         self._debug_print("Global toggle successful after second click")
@@ -277,40 +877,18 @@ class AmbossScraper:
     def _try_aria_expanded_buttons(self):
         """Try buttons with aria-expanded attribute"""
         try:
-            # Find buttons that might be collapsed
-            buttons = self.driver.find_elements(By.CSS_SELECTOR, 'button[aria-expanded]')
+            # Click every collapsed button (and re-toggle expanded ones) in one round-trip
+            shown_before = self._count_shown_sections()
+            total, collapsed, expanded = self.driver.execute_script(_CLICK_ARIA_EXPANDED_JS)
             
-            if not buttons:
+            if not total:
                 return False
             
-            self._debug_print(f"Found {len(buttons)} buttons with aria-expanded")
+            self._debug_print(f"Found {total} buttons with aria-expanded")
+            self._debug_print(f"Clicked {collapsed} collapsed and re-toggled {expanded} expanded buttons")
             
-            clicked_any = False
-            for button in buttons:
-                try:
-                    aria_expanded = button.get_attribute('aria-expanded')
-                    self._debug_print(f"Button aria-expanded: {aria_expanded}")
-                    
-                    if aria_expanded == 'false':
-                        self._debug_print(f"Clicking collapsed button (aria-expanded=false)")
-                        self.driver.execute_script("arguments[0].click();", button)
-                        time.sleep(1)
-                        clicked_any = True
-                    elif aria_expanded == 'true':
-                        # Try clicking expanded buttons too - might toggle to expand more
-                        self._debug_print(f"Clicking expanded button to see if it toggles more content")
-                        self.driver.execute_script("arguments[0].click();", button)
-                        time.sleep(0.5)
-                        self.driver.execute_script("arguments[0].click();", button)
-                        time.sleep(1)
-                        clicked_any = True
-                        
-                except Exception as e:
-                    self._debug_print(f"Error clicking aria-expanded button: {e}")
-                    continue
-            
-            if clicked_any:
-                time.sleep(2)
+            if collapsed or expanded:
+                self._wait_for_sections_settled(shown_before)
                 # Always return True if we clicked something - let the extraction handle it
                 self._debug_print("Clicked aria-expanded buttons")
                 return True
@@ -324,38 +902,14 @@ class AmbossScraper:
     def _try_section_headers(self):
         """Try clicking on section headers to expand them"""
         try:
-            # Find section headers that might be clickable
-            header_selectors = [
-                '[data-e2e-test-id="section-with-header"] [role="button"]',
-                '[data-e2e-test-id="section-with-header"] button',
-                '[data-e2e-test-id="section-with-header"] h3',
-                '[data-e2e-test-id="section-with-header"] h4',
-                '[data-e2e-test-id="section-with-header"] [class*="header"]'
-            ]
-            
-            clicked_any = False
-            for selector in header_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        self._debug_print(f"Clicking {len(elements)} elements with selector: {selector}")
-                        
-                        for i, element in enumerate(elements):
-                            try:
-                                if element.is_displayed():
-                                    self._debug_print(f"Clicking element {i+1}/{len(elements)}")
-                                    self.driver.execute_script("arguments[0].click();", element)
-                                    time.sleep(0.3)
-                                    clicked_any = True
-                            except Exception as e:
-                                self._debug_print(f"Error clicking element {i+1}: {e}")
-                                continue
-                except Exception as e:
-                    self._debug_print(f"Error with selector {selector}: {e}")
-                    continue
+            shown_before = self._count_shown_sections()
+            
+            # Click all visible headers for every selector in one round-trip
+            clicked = self.driver.execute_script(_CLICK_VISIBLE_JS, _HEADER_SELECTORS)
             
-            if clicked_any:
-                time.sleep(2)
+            if clicked:
+                self._debug_print(f"Clicked {clicked} section header elements")
+                self._wait_for_sections_settled(shown_before)
                 # Always return True if we clicked something
                 self._debug_print("Clicked section headers")
                 return True
@@ -379,21 +933,9 @@ class AmbossScraper:
                 self._debug_print(f"Found {len(visible_content)} visible content sections")
                 return True
             
-            # Also check for any content that might be visible
-            sections = self.driver.find_elements(
-                By.CSS_SELECTOR, 
-                '[data-e2e-test-id="section-with-header"]'
-            )
-            
-            visible_sections = 0
-            for section in sections:
-                try:
-                    # Check if section has substantial text content
-                    text_content = section.text.strip()
-                    if text_content and len(text_content) > 50:  # Reasonable content length
-                        visible_sections += 1
-                except:
-                    continue
+            # Also check for any content that might be visible, counting sections
+            # with substantial rendered text in a single round-trip
+            visible_sections = self.driver.execute_script(_COUNT_SECTIONS_WITH_TEXT_JS, 50)
             
             if visible_sections > 0:
                 self._debug_print(f"Found {visible_sections} sections with substantial content")
@@ -405,37 +947,58 @@ class AmbossScraper:
             self._debug_print(f"Error checking content visibility: {e}")
             return False
     
-    def extract_article_title(self, html_content):
+    def _count_shown_sections(self):
+        """Count section bodies currently rendered in expanded state"""
+        return len(self.driver.find_elements(
+            By.CSS_SELECTOR,
+            '[data-e2e-test-id="section-content-is-shown"]'
+        ))
+    
+    def _wait_for_sections_settled(self, shown_before, timeout=_WAIT_TIMEOUT):
         """
-        Extract article title from the page
+        Wait until sections expanded by a click have finished rendering
+        
+        Done once no collapsed section container is left, or once the number
+        of expanded sections has moved off shown_before and then held steady
+        for a poll, so no section is captured while it is still opening.
         
-        Args:
-            html_content (str): HTML content of the page
-            
         Returns:
-            str or None: Article title if found, None otherwise
+            bool: True if the sections settled, False on timeout
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        last_shown = [shown_before]
         
-        # Find the article header element
-        article_header = soup.find(attrs={'data-e2e-test-id': 'articleHeader'})
+        def settled(driver):
+            shown, hidden = driver.execute_script(_COUNT_SECTION_STATES_JS)
+            steady = shown == last_shown[0] != shown_before
+            last_shown[0] = shown
+            return not hidden or steady
         
-        if article_header:
-            # Try to find the title in various locations within the header
-            title_element = (
-                article_header.find('h1') or 
-                article_header.find('h2') or 
-                article_header.find(class_=lambda x: x and 'title' in x.lower()) or
-                article_header
-            )
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=_WAIT_POLL_FREQUENCY).until(settled)
+            return True
+        except TimeoutException:
+            return False
+    
+    def parse_html(self, html_content, from_encoding=None):
+        """
+        Build the soup used for all extraction from a page's HTML
+        
+        Args:
+            html_content (str or bytes): HTML content of the page
+            from_encoding (str): Encoding of bytes input, skips encoding detection
             
-            if title_element:
-                title = self.clean_text(title_element.get_text())
-                self._debug_print(f"Found article title: {title}")
-                return title
+        Returns:
+            BeautifulSoup: Soup restricted to the title, h1 headings, article
+                header and sections, or of the whole page if the restricted
+                parse found no sections
+        """
+        soup = BeautifulSoup(html_content, 'lxml', parse_only=ARTICLE_STRAINER, from_encoding=from_encoding)
+        if soup.find('section', {'data-e2e-test-id': 'section-with-header'}):
+            return soup
         
-        self._debug_print("Could not find article title")
-        return None
+        # Unfamiliar markup: parse the whole page once so nothing is filtered away
+        self._debug_print("No sections in restricted parse, parsing full page")
+        return BeautifulSoup(html_content, 'lxml', from_encoding=from_encoding)
     
     def extract_section_title(self, section):
         """
@@ -443,46 +1006,42 @@ class AmbossScraper:
         """
         # Try multiple strategies to find the section title
         
-        # Strategy 1: Look for data-e2e-test-id="particle-header"
-        header_element = section.find('div', {'data-e2e-test-id': 'particle-header'})
-        if header_element:
-            h3_element = header_element.find('h3')
-            if h3_element:
-                title = self.clean_text(h3_element.get_text())
-                if title:
-                    return title
+        # Strategy 1: Look for an h3 inside data-e2e-test-id="particle-header"
+        h3_element = section.select_one(_PARTICLE_HEADER_TITLE_SELECTOR)
+        if h3_element:
+            title = self.clean_text(self._fast_text(h3_element))
+            if title:
+                return title
         
         # Strategy 2: Look for any h3 in header area
-        header_container = section.find('div', class_=lambda x: x and 'header' in x.lower())
+        header_container = section.find('div', class_=_HEADER_CLS_RE)
         if header_container:
             h3_element = header_container.find('h3')
             if h3_element:
-                title = self.clean_text(h3_element.get_text())
+                title = self.clean_text(self._fast_text(h3_element))
                 if title:
                     return title
         
         # Strategy 3: Look for any h3 in the section
         h3_element = section.find('h3')
         if h3_element:
-            title = self.clean_text(h3_element.get_text())
+            title = self.clean_text(self._fast_text(h3_element))
             if title:
                 return title
         
         # Strategy 4: Look for button or clickable element with text
-        button_elements = section.find_all(['button', 'div'], class_=lambda x: x and any(
-            keyword in x.lower() for keyword in ['header', 'title', 'button']
-        ))
+        button_elements = section.find_all(['button', 'div'], class_=_HEADER_BTN_CLS_RE)
         for button in button_elements:
-            text = self.clean_text(button.get_text())
+            text = self.clean_text(self._fast_text(button))
             if text and len(text) < 100:  # Reasonable title length
                 return text
         
         # Strategy 5: Look for any text in header-like elements
         for elem in section.find_all(['div', 'span'], limit=10):
-            if elem.get('class'):
-                classes = ' '.join(elem.get('class', []))
-                if any(keyword in classes.lower() for keyword in ['header', 'title']):
-                    text = self.clean_text(elem.get_text())
+            classes = elem.get('class')
+            if classes:
+                if _HEADER_TITLE_CLS_RE.search(' '.join(classes)):
+                    text = self.clean_text(self._fast_text(elem))
                     if text and 5 < len(text) < 100:
                         return text
         
@@ -506,17 +1065,15 @@ class AmbossScraper:
             
             # Extract section title
             title = self.extract_section_title_from_element(section)
-            if title:
-                section_data['title'] = title
-            else:
-                section_data['title'] = f"Section {i+1}"
             
-            # Skip References section
-            if 'references' in section_data['title'].lower():
+            # Skip References section before walking its content
+            if title and _REFERENCES_RE.search(title):
                 if self.debug:
-                    print(f"DEBUG: ⏭ Skipping section: {section_data['title']}")
+                    print(f"DEBUG: ⏭ Skipping section: {title}")
                 continue
             
+            section_data['title'] = title or f"Section {i+1}"
+            
             # Extract section content
             content = self.extract_content_from_section(section)
             if content:
@@ -535,97 +1092,20 @@ class AmbossScraper:
         # Look for h3 element
         h3_element = section.find('h3')
         if h3_element:
-            title = self.clean_text(h3_element.get_text())
+            title = self.clean_text(self._fast_text(h3_element))
             if title:
                 return title
         return None
 
     def extract_content_from_section(self, section):
         """Extract content from a section with comprehensive formatting"""
-        content_parts = []
-        
         # Find the content container
         content_container = (
             section.find('div', {'data-e2e-test-id': 'section-content-is-shown'}) or
             section.find('div', {'data-e2e-test-id': 'section-content-is-hidden'})
         )
         
-        if not content_container:
-            return ""
-        
-        # Find the base styles container
-        base_content = content_container.find('div', class_=lambda x: x and 'baseStyles' in x)
-        if not base_content:
-            base_content = content_container
-        
-        # Process all direct children
-        for child in base_content.children:
-            if hasattr(child, 'name') and child.name:
-                if child.name == 'h3':
-                    # Subsection headers
-                    title = self.clean_text(child.get_text())
-                    if title:
-                        content_parts.append(f"<h3>{title}</h3>")
-                
-                elif child.name == 'div' and 'table-wrapper' in child.get('class', []):
-                    # Tables
-                    table = child.find('table')
-                    if table:
-                        table_content = self.format_table_with_bullets(table)
-                        if table_content:
-                            content_parts.append(table_content)
-                
-                elif child.name == 'ul':
-                    # Lists
-                    list_content = self.process_list(child)
-                    if list_content:
-                        content_parts.append("<ul>")
-                        content_parts.extend(list_content)
-                        content_parts.append("</ul>")
-                
-                elif child.name == 'div' and 'paragraph' in child.get('class', []):
-                    # Paragraphs that might contain images
-                    images = child.find_all('span', class_='thumbnail__image')
-                    for img in images:
-                        img_content = self.extract_image_info(img)
-                        if img_content:
-                            content_parts.append('<div class="image-container">')
-                            content_parts.append(img_content)
-                            content_parts.append('</div>')
-                    
-                    # Also extract text content if no images
-                    if not images:
-                        text_content = self.clean_text(child.get_text())
-                        if text_content:
-                            content_parts.append(f"<p>{text_content}</p>")
-                
-                elif child.name == 'div' and any(cls in child.get('class', []) for cls in ['merke', 'cave', 'content-box']):
-                    # Content boxes
-                    classes = child.get('class', [])
-                    content_text = self.clean_text(child.get_text())
-                    if content_text:
-                        if 'merke' in classes or 'green' in classes:
-                            content_parts.append(f'<div class="content-box note">💡 **Note:** {content_text}</div>')
-                        elif 'cave' in classes or 'red' in classes:
-                            content_parts.append(f'<div class="content-box warning">⚠️ **Warning:** {content_text}</div>')
-                        elif 'blue' in classes:
-                            content_parts.append(f'<div class="content-box tip">📝 **Tip:** {content_text}</div>')
-                        else:
-                            content_parts.append(f'<div class="content-box note">💡 **Note:** {content_text}</div>')
-                
-                elif child.name == 'p':
-                    # Direct paragraph elements
-                    text_content = self.clean_text(child.get_text())
-                    if text_content:
-                        content_parts.append(f"<p>{text_content}</p>")
-                
-                else:
-                    # Handle any other content that might contain text
-                    processed_content = self.extract_generic_content(child)
-                    if processed_content:
-                        content_parts.append(processed_content)
-        
-        return "\n".join(content_parts)
+        return self.extract_full_content(content_container)
     
     def extract_generic_content(self, element):
         """Extract content from generic elements, handling text and nested structures"""
@@ -634,8 +1114,8 @@ class AmbossScraper:
         
         # Skip if it's a complex container we already handle
         if element.name == 'div':
-            classes = element.get('class', [])
-            if any(cls in classes for cls in ['table-wrapper', 'paragraph', 'merke', 'cave', 'content-box']):
+            classes = element.get('class') or ()
+            if _HANDLED_DIV_CLASSES.intersection(classes):
                 return ""
         
         # Check if it contains complex nested elements
@@ -644,7 +1124,7 @@ class AmbossScraper:
             return ""  # Skip complex nested structures
         
         # Extract text content
-        text_content = self.clean_text(element.get_text())
+        text_content = self.clean_text(self._fast_text(element))
         if text_content and len(text_content) > 10:  # Avoid very short fragments
             # If it's a reasonable length and looks like a paragraph, format it as such
             if len(text_content) > 20:
@@ -657,23 +1137,39 @@ class AmbossScraper:
         if not content_container:
             return ""
         
-        content_parts = []
-        
         # Find the base styles container
-        base_content = content_container.find('div', class_=lambda x: x and 'baseStyles' in x)
+        base_content = content_container.find('div', class_=_BASE_STYLES_RE)
         if not base_content:
             base_content = content_container
         
+        return "\n".join(self._render_base_content(base_content))
+    
+    def _render_base_content(self, base_content):
+        """
+        Render the direct children of a section body as HTML fragments
+        
+        Args:
+            base_content: Tag whose children hold the section content
+            
+        Returns:
+            list: HTML fragments in document order
+        """
+        content_parts = []
+        
         # Process all direct children
         for child in base_content.children:
-            if hasattr(child, 'name') and child.name:
-                if child.name == 'h3':
+            tag = child.name
+            if tag:
+                # Only the div branches look at classes
+                classes = frozenset(child.get('class') or ()) if tag == 'div' else frozenset()
+                
+                if tag == 'h3':
                     # Subsection headers
-                    title = self.clean_text(child.get_text())
+                    title = self.clean_text(self._fast_text(child))
                     if title:
                         content_parts.append(f"<h3>{title}</h3>")
                 
-                elif child.name == 'div' and 'table-wrapper' in child.get('class', []):
+                elif tag == 'div' and 'table-wrapper' in classes:
                     # Tables
                     table = child.find('table')
                     if table:
@@ -681,7 +1177,7 @@ class AmbossScraper:
                         if table_content:
                             content_parts.append(table_content)
                 
-                elif child.name == 'ul':
+                elif tag == 'ul':
                     # Lists
                     list_content = self.process_list(child)
                     if list_content:
@@ -689,7 +1185,7 @@ class AmbossScraper:
                         content_parts.extend(list_content)
                         content_parts.append("</ul>")
                 
-                elif child.name == 'div' and 'paragraph' in child.get('class', []):
+                elif tag == 'div' and 'paragraph' in classes:
                     # Paragraphs that might contain images
                     images = child.find_all('span', class_='thumbnail__image')
                     for img in images:
@@ -701,132 +1197,115 @@ class AmbossScraper:
                     
                     # Also extract text content if no images
                     if not images:
-                        text_content = self.clean_text(child.get_text())
+                        text_content = self.clean_text(self._fast_text(child))
                         if text_content:
                             content_parts.append(f"<p>{text_content}</p>")
                 
-                elif child.name == 'div' and any(cls in child.get('class', []) for cls in ['merke', 'cave', 'content-box']):
+                elif tag == 'div' and classes & _BOX_CLASSES:
                     # Content boxes
-                    classes = child.get('class', [])
-                    content_text = self.clean_text(child.get_text())
+                    content_text = self.clean_text(self._fast_text(child))
                     if content_text:
                         if 'merke' in classes or 'green' in classes:
-                            content_parts.append(f'<div class="content-box note">💡 **Note:** {content_text}</div>')
+                            kind = 'note'
                         elif 'cave' in classes or 'red' in classes:
-                            content_parts.append(f'<div class="content-box warning">⚠️ **Warning:** {content_text}</div>')
+                            kind = 'warning'
                         elif 'blue' in classes:
-                            content_parts.append(f'<div class="content-box tip">📝 **Tip:** {content_text}</div>')
+                            kind = 'tip'
                         else:
-                            content_parts.append(f'<div class="content-box note">💡 **Note:** {content_text}</div>')
+                            kind = 'note'
+                        content_parts.append(_BOX_TMPLS[kind] % content_text)
+                
+                elif tag == 'p':
+                    # Direct paragraph elements
+                    text_content = self.clean_text(self._fast_text(child))
+                    if text_content:
+                        content_parts.append(f"<p>{text_content}</p>")
+                
+                else:
+                    # Handle any other content that might contain text
+                    processed_content = self.extract_generic_content(child)
+                    if processed_content:
+                        content_parts.append(processed_content)
         
-        return "\n".join(content_parts)
-    
-
+        return content_parts
     
     def format_table_with_bullets(self, table_element):
         """Format table exactly like the desired example"""
         if not table_element:
             return ""
         
-        rows = []
+        header_html = ""
+        body_rows = []
         
-        # Extract headers
+        # Walk only the table's own structure (section > row > cell) instead of
+        # searching every cell's subtree for further rows and cells
         thead = table_element.find('thead')
         if thead:
-            header_row = thead.find('tr')
-            if header_row:
-                headers = []
-                for th in header_row.find_all(['th', 'td']):
-                    header_text = self.clean_text(th.get_text())
-                    headers.append(header_text if header_text else " ")
+            header_rows = _child_tags(thead, ('tr',))
+            if header_rows:
+                header_cells = []
+                for th in _child_tags(header_rows[0], ('th', 'td')):
+                    header_text = self.clean_text(self._fast_text(th))
+                    header_cells.append(header_text if header_text else " ")
                 
-                if headers:
-                    rows.append("| " + " | ".join(headers) + " |")
-                    rows.append("| " + " | ".join(["---"] * len(headers)) + " |")
+                # Render the header once, as soon as its cells are known
+                if header_cells:
+                    header_html = "<thead>\n<tr>\n" + "\n".join(f"<th>{h}</th>" for h in header_cells) + "\n</tr>\n</thead>"
         
         # Extract body rows
         tbody = table_element.find('tbody')
         if tbody:
-            for tr in tbody.find_all('tr'):
-                cells = []
-                for td in tr.find_all(['td', 'th']):
+            # Row and bullet buffers are rendered to strings right away, so one
+            # of each is cleared and reused for the whole table
+            cells = []
+            bullet_content = []
+            for tr in _child_tags(tbody, ('tr',)):
+                cells.clear()
+                for td in _child_tags(tr, ('td', 'th')):
                     # Check if cell contains lists
-                    top_level_lists = td.find_all('ul', recursive=False)
+                    top_level_lists = _child_tags(td, ('ul',))
                     if top_level_lists:
                         # Build bullet list content with line breaks
-                        bullet_content = []
-                        
-                        def process_list_item(li_element, bullet_char="•", indent=""):
-                            """Recursively process list items and their nested lists"""
-                            # Get the direct text content of this li (excluding nested ul content)
-                            li_text_parts = []
-                            for content in li_element.contents:
-                                if hasattr(content, 'name') and content.name == 'ul':
-                                    break  # Stop when we hit nested ul
-                                elif hasattr(content, 'get_text'):
-                                    text = self.clean_text(content.get_text())
-                                    if text:
-                                        li_text_parts.append(text)
-                                elif isinstance(content, str) and content.strip():
-                                    cleaned = self.clean_text(content)
-                                    if cleaned:
-                                        li_text_parts.append(cleaned)
-                            
-                            li_text = " ".join(li_text_parts).strip()
-                            if li_text:
-                                bullet_content.append(f"{indent}{bullet_char} {li_text}")
-                            
-                            # Process nested lists
-                            nested_ul = li_element.find('ul', recursive=False)
-                            if nested_ul:
-                                for nested_li in nested_ul.find_all('li', recursive=False):
-                                    process_list_item(nested_li, "◦", "&nbsp;&nbsp;&nbsp;&nbsp;")
-                        
-                        # Process all top-level lists
+                        bullet_content.clear()
                         for ul in top_level_lists:
-                            for li in ul.find_all('li', recursive=False):
-                                process_list_item(li)
+                            for li in _child_tags(ul, ('li',)):
+                                _process_table_li(li, bullet_content, self.clean_text)
                         
-                        # Join with line breaks and escape pipes
-                        cell_text = "<br/>".join(bullet_content).replace('|', '\\|')
-                        cells.append(cell_text)
+                        # Join with line breaks
+                        cells.append("<br/>".join(bullet_content))
                     else:
                         # No lists, just get text content
-                        cell_text = self.clean_text(td.get_text())
-                        if cell_text:
-                            cell_text = cell_text.replace('\n', ' ').replace('|', '\\|')
-                            cells.append(cell_text)
-                        else:
-                            cells.append("")
+                        cells.append(self.clean_text(self._fast_text(td)))
                 
                 if cells:
-                    rows.append("| " + " | ".join(cells) + " |")
+                    body_rows.append("<tr>\n" + "\n".join(f"<td>{cell}</td>" for cell in cells) + "\n</tr>")
         
-        if rows:
-            return "\n<table>\n<thead>\n<tr>\n" + "\n".join(f"<th>{h}</th>" for h in rows[0].split('|')[1:-1]) + "\n</tr>\n</thead>\n<tbody>\n" + "\n".join(f"<tr>\n" + "\n".join(f"<td>{cell}</td>" for cell in row.split('|')[1:-1]) + "\n</tr>" for row in rows[2:]) + "\n</tbody>\n</table>\n"
-        else:
+        if not header_html and not body_rows:
             return ""
+        
+        parts = ["\n<table>"]
+        if header_html:
+            parts.append(header_html)
+        parts.append("<tbody>")
+        parts.extend(body_rows)
+        parts.append("</tbody>\n</table>\n")
+        return "\n".join(parts)
 
     def process_list(self, ul_element):
         """Process lists with proper nested formatting"""
         content = []
-        
-        for li in ul_element.find_all('li', recursive=False):
-            # Get the direct text content of this li (excluding nested ul content)
-            li_text_parts = []
-            for child in li.children:
-                if hasattr(child, 'name') and child.name == 'ul':
-                    break  # Stop when we hit nested ul
-                elif hasattr(child, 'get_text'):
-                    text = self.clean_text(child.get_text())
-                    if text:
-                        li_text_parts.append(text)
-                elif isinstance(child, str) and child.strip():
-                    cleaned = self.clean_text(child)
-                    if cleaned:
-                        li_text_parts.append(cleaned)
+        # Work stack of li elements still to render and closing tags (strings)
+        # still to emit, popped in document order
+        stack = list(reversed(_child_tags(ul_element, ('li',))))
+        li_text_parts = []
+        
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                content.append(item)
+                continue
             
-            li_text = " ".join(li_text_parts).strip()
+            li_text, nested_ul = _split_list_item(item, self.clean_text, li_text_parts)
             
             # Start the list item
             if li_text:
@@ -834,16 +1313,12 @@ class AmbossScraper:
             else:
                 content.append("<li>")
             
-            # Process nested lists
-            nested_ul = li.find('ul', recursive=False)
-            if nested_ul:
+            # Close the list item after any nested list
+            stack.append("</li>")
+            if nested_ul is not None:
                 content.append("<ul>")
-                nested_content = self.process_list(nested_ul)
-                content.extend(nested_content)
-                content.append("</ul>")
-            
-            # Close the list item
-            content.append("</li>")
+                stack.append("</ul>")
+                stack.extend(reversed(_child_tags(nested_ul, ('li',))))
         
         return content
 
@@ -858,46 +1333,67 @@ class AmbossScraper:
             return ""
         
         # Get image URL from src
-        image_url = img_element.get('src', '')
+        image_url = img_element.get('src')
         if not image_url:
             return ""
         
         # Fix relative URLs
-        if image_url.startswith('//'):
-            image_url = 'https:' + image_url
-        elif image_url.startswith('/'):
-            image_url = 'https://next.amboss.com' + image_url
+        if image_url[0] == '/':
+            if image_url[1:2] == '/':
+                image_url = 'https:' + image_url
+            else:
+                image_url = 'https://next.amboss.com' + image_url
         
-        # Get title/caption from title attribute or span title
-        title = img_element.get('title', '') or img_span.find('span', class_='thumbnail__image__title')
-        if hasattr(title, 'get_text'):
-            title = title.get_text()
+        # Get title/caption from title attribute, searching for the span title
+        # only when the attribute is missing
+        title = img_element.get('title')
+        if not title:
+            title_span = img_span.find('span', class_='thumbnail__image__title')
+            if title_span:
+                title = title_span.get_text()
         
         if not title:
             title = "Medical Image"
         
         # Format as centered image with HTML exactly like desired example
-        return f'<div style="text-align: center; margin: 20px 0;"><img src="{image_url}" alt="{title}" width="400" style="max-width: 100%; height: auto;"><p><em>{title}</em></p></div>'
+        return _IMG_TMPL.format(src=image_url, title=title)
+    
+    def _fast_text(self, element):
+        """
+        Return the concatenated text of an element
+        
+        Equivalent to element.get_text(), but leaf tags holding a single text
+        node return that node directly instead of walking their descendants.
+        """
+        contents = element.contents
+        if len(contents) == 1 and type(contents[0]) is NavigableString:
+            return contents[0]
+        return element.get_text()
     
     def clean_text(self, text):
         """Clean and normalize extracted text"""
         if not text:
             return ""
         
-        # Remove extra whitespace and normalize
-        text = ' '.join(text.split())
+        # Most fragments are empty or whitespace-only; skip all regex work for them
+        text = text.strip()
+        if not text:
+            return ""
         
-        # Remove reference numbers like [1], [2], etc.
-        text = re.sub(r'\[\d+\](?:\[\d+\])*', '', text)
+        # Drop stray control characters, then collapse whitespace runs (printable
+        # text has neither, at most runs of plain spaces)
+        if not text.isprintable():
+            text = _WS_RE.sub(' ', text.translate(_CTRL_TABLE))
+        elif '  ' in text:
+            text = _WS_RE.sub(' ', text)
         
-        # Remove unwanted UI elements
-        unwanted_strings = ["Maximize table", "Table Quiz", "Collapse", "Notes", "Feedback"]
-        for unwanted in unwanted_strings:
-            text = text.replace(unwanted, "")
+        # Remove reference numbers like [1], [2], etc. and unwanted UI elements
+        if '[' in text or any(label in text for label in _UNWANTED_STRINGS):
+            text = _CLEANUP_RE.sub('', text)
         
         return text.strip()
     
-    def format_output(self, sections, output_format='text', article_title=None):
+    def format_output(self, sections, output_format='text', article_title=None, standalone=True):
         """
         Format extracted content in the specified format
         
@@ -905,6 +1401,8 @@ class AmbossScraper:
             sections (list): List of section dictionaries
             output_format (str): 'text', 'markdown', or 'html'
             article_title (str): Main article title
+            standalone (bool): Embed the stylesheet in HTML output; when False the
+                page links the shared styles.css instead
             
         Returns:
             str: Formatted content
@@ -914,246 +1412,81 @@ class AmbossScraper:
         elif output_format == 'markdown':
             return self._format_markdown(sections, article_title)
         elif output_format == 'html':
-            return self._format_html(sections, article_title)
+            return self._format_html(sections, article_title, standalone)
         else:
             raise ValueError(f"Unsupported output format: {output_format}")
     
     def _format_text(self, sections, article_title):
         """Format content as plain text"""
-        output = []
+        buf = io.StringIO()
+        w = buf.write
         if article_title:
-            output.append(f"# {article_title}")
-            output.append("")
+            w(f"# {article_title}\n")
         
         for i, section in enumerate(sections, 1):
-            output.append(f"=== Section {i}: {section['title']} ===")
-            output.append(section['content'])
-            output.append("")
-        
-        return '\n'.join(output)
+            # Blank line between blocks
+            if buf.tell():
+                w("\n")
+            w(f"=== Section {i}: {section['title']} ===\n")
+            w(section['content'])
+            w("\n")
+        
+        return buf.getvalue()
     
     def _format_markdown(self, sections, article_title):
         """Format content as Markdown"""
-        output = []
+        buf = io.StringIO()
+        w = buf.write
         if article_title:
-            output.append(f"# {article_title}")
-            output.append("")
+            w(f"# {article_title}\n")
         
         for section in sections:
-            output.append(f"## {section['title']}")
-            output.append("")
-            output.append(section['content'])
-            output.append("")
-        
-        return '\n'.join(output)
+            # Blank line between blocks
+            if buf.tell():
+                w("\n")
+            w(f"## {section['title']}\n\n")
+            w(section['content'])
+            w("\n")
+        
+        return buf.getvalue()
     
-    def _format_html(self, sections, article_title):
+    def _format_html(self, sections, article_title, standalone=True):
         """Format content as HTML with exact CSS from old working version"""
         page_title = article_title or "AMBOSS Content"
         
-        html_parts = [
-            '<!DOCTYPE html>',
-            '<html lang="en">',
-            '<head>',
-            '    <meta charset="UTF-8">',
-            '    <meta name="viewport" content="width=device-width, initial-scale=1.0">',
-            f'    <title>{page_title}</title>',
-            '    <style>',
-            '        /* Print-friendly styles */',
-            '        @media print {',
-            '            body { ',
-            '                font-family: \'Times New Roman\', serif;',
-            '                font-size: 12pt;',
-            '                line-height: 1.4;',
-            '                margin: 0.5in;',
-            '                color: black;',
-            '            }',
-            '            ',
-            '            /* Section-level styling */',
-            '            .section {',
-            '                margin-bottom: 20pt;',
-            '            }',
-            '            ',
-            '            /* Main section titles (h2) */',
-            '            .section-title {',
-            '                font-size: 16pt;',
-            '                font-weight: bold;',
-            '                margin-top: 24pt;',
-            '                margin-bottom: 12pt;',
-            '                border-bottom: 2pt solid #333;',
-            '                padding-bottom: 6pt;',
-            '            }',
-            '            ',
-            '            /* Subsection titles (h3) */',
-            '            h3 {',
-            '                font-size: 14pt;',
-            '                font-weight: bold;',
-            '                margin-top: 18pt;',
-            '                margin-bottom: 8pt;',
-            '            }',
-            '            ',
-            '            /* Sub-subsection titles (h4) */',
-            '            h4 {',
-            '                font-size: 13pt;',
-            '                font-weight: bold;',
-            '                margin-top: 14pt;',
-            '                margin-bottom: 6pt;',
-            '            }',
-            '            ',
-            '            /* Content boxes */',
-            '            .content-box {',
-            '                border: 1pt solid #666;',
-            '                padding: 8pt;',
-            '                margin: 12pt 0;',
-            '                background-color: #f9f9f9;',
-            '            }',
-            '            .note { border-left: 4pt solid #4CAF50; }',
-            '            .warning { border-left: 4pt solid #f44336; }',
-            '            .tip { border-left: 4pt solid #2196F3; }',
-            '            .important { border-left: 4pt solid #FF9800; }',
-            '            ',
-            '            /* Tables */',
-            '            table {',
-            '                border-collapse: collapse;',
-            '                width: 100%;',
-            '                margin: 12pt 0;',
-            '            }',
-            '            th, td {',
-            '                border: 1pt solid #333;',
-            '                padding: 6pt;',
-            '                text-align: left;',
-            '                vertical-align: top;',
-            '            }',
-            '            th {',
-            '                background-color: #f0f0f0;',
-            '                font-weight: bold;',
-            '            }',
-            '            ',
-            '            /* Images */',
-            '            img {',
-            '                max-width: 100%;',
-            '                height: auto;',
-            '                display: block;',
-            '                margin: 12pt auto;',
-            '            }',
-            '            ',
-            '            /* Image containers */',
-            '            .image-container {',
-            '                margin: 12pt 0;',
-            '            }',
-            '            ',
-            '            /* Lists */',
-            '            ul, ol {',
-            '                margin: 8pt 0;',
-            '                padding-left: 20pt;',
-            '            }',
-            '            ',
-            '            /* Individual list items */',
-            '            li {',
-            '                margin: 4pt 0;',
-            '            }',
-            '            ',
-            '            /* Nested lists */',
-            '            ul ul, ol ol, ul ol, ol ul {',
-            '                margin: 4pt 0;',
-            '            }',
-            '            ',
-            '            /* Paragraphs */',
-            '            p {',
-            '                margin: 8pt 0;',
-            '            }',
-            '        }',
-            '',
-            '        /* Screen styles */',
-            '        @media screen {',
-            '            body {',
-            '                font-family: -apple-system, BlinkMacSystemFont, \'Segoe UI\', Roboto, sans-serif;',
-            '                max-width: 800px;',
-            '                margin: 0 auto;',
-            '                padding: 20px;',
-            '                line-height: 1.6;',
-            '                background-color: #fff;',
-            '            }',
-            '            .section {',
-            '                margin-bottom: 30px;',
-            '                padding: 20px;',
-            '                border-radius: 8px;',
-            '                box-shadow: 0 2px 4px rgba(0,0,0,0.1);',
-            '            }',
-            '            .section-title {',
-            '                font-size: 24px;',
-            '                font-weight: bold;',
-            '                margin-bottom: 15px;',
-            '                color: #333;',
-            '                border-bottom: 2px solid #007acc;',
-            '                padding-bottom: 8px;',
-            '            }',
-            '            .content-box {',
-            '                border-radius: 6px;',
-            '                padding: 15px;',
-            '                margin: 15px 0;',
-            '            }',
-            '            .note { ',
-            '                background-color: #e8f5e8; ',
-            '                border-left: 4px solid #4CAF50; ',
-            '            }',
-            '            .warning { ',
-            '                background-color: #ffeaea; ',
-            '                border-left: 4px solid #f44336; ',
-            '            }',
-            '            .tip { ',
-            '                background-color: #e3f2fd; ',
-            '                border-left: 4px solid #2196F3; ',
-            '            }',
-            '            .important { ',
-            '                background-color: #fff3e0; ',
-            '                border-left: 4px solid #FF9800; ',
-            '            }',
-            '',
-            '            table {',
-            '                border-collapse: collapse;',
-            '                width: 100%;',
-            '                margin: 15px 0;',
-            '                box-shadow: 0 1px 3px rgba(0,0,0,0.1);',
-            '            }',
-            '            th, td {',
-            '                border: 1px solid #ddd;',
-            '                padding: 12px;',
-            '                text-align: left;',
-            '            }',
-            '            th {',
-            '                background-color: #f8f9fa;',
-            '                font-weight: 600;',
-            '            }',
-            '            tr:nth-child(even) {',
-            '                background-color: #f8f9fa;',
-            '            }',
-            '        }',
-            '</style>',
-            '</head>',
-            '<body>'
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w('<!DOCTYPE html>\n'
+          '<html lang="en">\n'
+          '<head>\n'
+          '    <meta charset="UTF-8">\n'
+          '    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n')
+        w(f'    <title>{page_title}</title>\n')
+        if standalone:
+            w(f'    <style>\n{_HTML_CSS}</style>\n')
+        else:
+            w(f'    <link rel="stylesheet" href="{_HTML_STYLESHEET_NAME}">\n')
+        w('</head>\n'
+          '<body>\n')
         
         # Add main title exactly like the examples
         if article_title:
-            html_parts.append('<div class="main-title-container" style="text-align: center; margin-bottom: 30px; border-bottom: 3px solid #007acc; padding-bottom: 15px;">')
-            html_parts.append(f'<h1 style="font-size: 28pt; color: #333; margin: 0;">{article_title}</h1>')
-            html_parts.append('</div>')
+            w('<div class="main-title-container" style="text-align: center; margin-bottom: 30px; border-bottom: 3px solid #007acc; padding-bottom: 15px;">\n')
+            w(f'<h1 style="font-size: 28pt; color: #333; margin: 0;">{article_title}</h1>\n')
+            w('</div>\n')
         
         # Add sections exactly like the examples
         for i, section in enumerate(sections, 1):
-            html_parts.append(f'<div class="section" id="section-{i}">')
-            html_parts.append(f'<h2 class="section-title">{section["title"]}</h2>')
+            w(f'<div class="section" id="section-{i}">\n')
+            w(f'<h2 class="section-title">{section["title"]}</h2>\n')
             
             # Content is already in HTML format, no conversion needed
-            content_html = section['content']
-            html_parts.append(content_html)
-            html_parts.append('</div>')
+            w(section['content'])
+            w('\n</div>\n')
         
-        html_parts.extend(['</body>', '</html>'])
-        return '\n'.join(html_parts)
-    
-
+        w('</body>\n'
+          '</html>')
+        return buf.getvalue()
     
     def generate_filename(self, url, index, output_format, article_title=None):
         """
@@ -1170,14 +1503,16 @@ class AmbossScraper:
         """
         if article_title:
             # Use article title as primary filename component
-            clean_title = re.sub(r'[^\w\s-]', '', article_title)
-            clean_title = re.sub(r'[-\s]+', '_', clean_title)
+            clean_title = _strip_filename_chars(article_title)
+            # Each run of hyphens/whitespace becomes one underscore (str.split
+            # uses the same whitespace definition as the regex \s)
+            clean_title = '_'.join(clean_title.replace('-', ' ').split())
             clean_title = clean_title.strip('_')[:50]
             page_name = clean_title if clean_title else "article"
         else:
             # Fallback to URL-based name
             page_name = url.split('/')[-1] or url.split('/')[-2]
-            page_name = re.sub(r'[^a-zA-Z0-9_-]', '_', page_name)[:50]
+            page_name = _url_slug(page_name)[:50]
         
         # Add extension
         ext_map = {'text': 'txt', 'markdown': 'md', 'html': 'html'}
@@ -1201,55 +1536,63 @@ class AmbossScraper:
             if not url.startswith(('http://', 'https://')):
                 return self.scrape_local_file(url, output_format)
             
+            # Without credentials there are no session cookies to borrow, so a
+            # plain HTTP fetch is tried before the browser is started at all
+            needs_login = bool(self.username and self.password)
+            if not needs_login:
+                result = self._scrape_over_http(url, output_format)
+                if result is not None:
+                    return result
+            
             # Handle web URLs
             if not self.driver:
                 if not self.setup_driver():
                     return "Error: Could not setup WebDriver", None
             
-            # Login if needed
-            if self.username and self.password:
+            # Login if needed, then try HTTP again with the login cookies
+            if needs_login:
                 if not self.login():
                     return "Error: Login failed", None
+                result = self._scrape_over_http(url, output_format)
+                if result is not None:
+                    return result
             
-            # Load target page
-            self._debug_print(f"Loading page: {url}")
-            self.driver.get(url)
-            
-            # Wait for page load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # Expand content
-            self.expand_content()
-            
-            # Extract content
-            html_content = self.driver.page_source
+            # Load and expand the target page in the browser
+            html_content = self._fetch_html_browser(url)
             
             if self.debug and self.debug_dir:
-                with open(f"{self.debug_dir}/final_page.html", "w", encoding="utf-8") as f:
-                    f.write(html_content)
+                self._save_debug_html("final_page.html", html_content)
             
-            sections, article_title = self.extract_sections(BeautifulSoup(html_content, 'html.parser'))
-            
-            if not sections:
-                return "No content found", None
-            
-            formatted_content = self.format_output(sections, output_format, article_title)
-            return formatted_content, article_title
+            return self.parse_and_format(html_content, output_format)
             
         except Exception as e:
             error_msg = f"Error scraping {url}: {str(e)}"
             self._debug_print(error_msg)
             return error_msg, None
     
-    def scrape_local_file(self, filepath, output_format='text'):
+    def _scrape_over_http(self, url, output_format):
+        """Fetch and format a page over HTTP; None when it needs the browser"""
+        html_content = self._fetch_html_http(url)
+        if html_content is None:
+            return None
+        
+        if self.debug and self.debug_dir:
+            self._save_debug_html("final_page.html", html_content)
+        
+        content, article_title = self.parse_and_format(html_content, output_format)
+        if content == _NO_CONTENT_MESSAGE:
+            self._debug_print("No sections in HTTP response, using browser")
+            return None
+        return content, article_title
+    
+    def scrape_local_file(self, filepath, output_format='text', standalone=True):
         """
         Scrape content from a local HTML file
         
         Args:
             filepath (str): Path to local HTML file
             output_format (str): Output format
+            standalone (bool): Embed the stylesheet in HTML output
             
         Returns:
             tuple: (content, article_title)
@@ -1257,17 +1600,17 @@ class AmbossScraper:
         try:
             self._debug_print(f"Reading local file: {filepath}")
             
-            # Read local HTML file
-            with open(filepath, 'r', encoding='utf-8') as f:
+            # Read local HTML file as raw bytes; lxml decodes them itself
+            with open(filepath, 'rb') as f:
                 html_content = f.read()
             
             # Extract content directly from HTML
-            sections, article_title = self.extract_sections(BeautifulSoup(html_content, 'html.parser'))
+            sections, article_title = self.extract_sections(self.parse_html(html_content, from_encoding='utf-8'))
             
             if not sections:
                 return "No content found in local file", None
             
-            formatted_content = self.format_output(sections, output_format, article_title)
+            formatted_content = self.format_output(sections, output_format, article_title, standalone)
             return formatted_content, article_title
             
         except FileNotFoundError:
@@ -1279,98 +1622,205 @@ class AmbossScraper:
             self._debug_print(error_msg)
             return error_msg, None
     
-    def scrape_url_batch(self, url, output_format='text'):
+    def scrape_url_batch(self, url, output_format='text', html_content=None, standalone=True):
         """
         Scrape a single URL in batch mode with enhanced debugging
+        
+        Args:
+            url (str): URL to scrape or local file path
+            output_format (str): Output format
+            html_content (str or bytes): Already fetched page HTML, skips loading the page
+            standalone (bool): Embed the stylesheet in HTML output
         """
         try:
             # Handle local files
             if not url.startswith(('http://', 'https://')):
-                return self.scrape_local_file(url, output_format)
-            
-            # Handle web URLs (driver should already be setup and logged in)
-            if not self.driver:
-                return "Error: Browser session not available", None
+                return self.scrape_local_file(url, output_format, standalone)
             
             # Load target page (no login needed - already done)
-            self._debug_print(f"Loading page: {url}")
-            self.driver.get(url)
-            
-            # Wait for page load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # Add debugging to see what's on the page
-            if self.debug:
-                self._debug_page_structure()
-            
-            # Expand content
-            self.expand_content()
-            
-            # Extract content
-            html_content = self.driver.page_source
-            
-            if self.debug and self.debug_dir:
-                # Use URL-specific debug filename
-                safe_url = re.sub(r'[^a-zA-Z0-9_-]', '_', url.split('/')[-1] or 'page')[:30]
-                with open(f"{self.debug_dir}/batch_{safe_url}.html", "w", encoding="utf-8") as f:
-                    f.write(html_content)
-            
-            sections, article_title = self.extract_sections(BeautifulSoup(html_content, 'html.parser'))
-            
-            if not sections:
-                return "No content found", None
+            html_content = self._fetch_batch_html(url, html_content)
+            if html_content is None:
+                return "Error: Browser session not available", None
             
-            formatted_content = self.format_output(sections, output_format, article_title)
-            return formatted_content, article_title
+            return self.parse_and_format(html_content, output_format, standalone)
             
         except Exception as e:
             error_msg = f"Error scraping {url}: {str(e)}"
             self._debug_print(error_msg)
             return error_msg, None
     
+    def _fetch_batch_html(self, url, html_content=None, http_tried=False):
+        """
+        Load a batch page unless already fetched; None when no browser session is available
+        
+        http_tried marks a page the HTTP prefetch already found unusable, which
+        goes straight to the browser instead of being requested again.
+        """
+        if html_content is None:
+            # Handle web URLs (driver should already be setup and logged in)
+            if not self.driver:
+                return None
+            
+            html_content = self._fetch_html_browser(url) if http_tried else self.fetch_html(url)
+        
+        if self.debug and self.debug_dir:
+            # Use URL-specific debug filename
+            safe_url = _url_slug(url.split('/')[-1] or 'page')[:30]
+            self._save_debug_html(f"batch_{safe_url}.html", html_content)
+        
+        return html_content
+    
+    def parse_and_format(self, html_content, output_format='text', standalone=True):
+        """
+        Extract and format the sections of already loaded page HTML
+        
+        Touches neither the browser nor the HTTP session, so it can run on a
+        worker thread while the next page loads.
+        
+        Args:
+            html_content (str or bytes): HTML content of the page
+            output_format (str): Output format
+            standalone (bool): Embed the stylesheet in HTML output
+            
+        Returns:
+            tuple: (content, article_title)
+        """
+        sections, article_title = self.extract_sections(self.parse_html(html_content))
+        
+        if not sections:
+            return _NO_CONTENT_MESSAGE, None
+        
+        formatted_content = self.format_output(sections, output_format, article_title, standalone)
+        return formatted_content, article_title
+    
+    def fetch_html(self, url):
+        """
+        Fetch the HTML of an article page
+        
+        Tries a plain HTTP request with the browser's session cookies first and
+        only falls back to loading and expanding the page in Selenium when the
+        response does not contain fully expanded article sections.
+        
+        Args:
+            url (str): Article URL
+            
+        Returns:
+            str or bytes: Page HTML; raw response bytes when fetched over HTTP
+        """
+        html_content = self._fetch_html_http(url)
+        if html_content is not None:
+            return html_content
+        
+        return self._fetch_html_browser(url)
+    
+    def _fetch_html_http(self, url):
+        """
+        Fetch page HTML over HTTP, returning None unless its sections are all expanded
+        
+        Returns the undecoded response body: the parser reads the page's own
+        charset declaration, so decoding it to str here would be wasted work.
+        """
+        if not self._http:
+            return None
+        
+        try:
+            self._debug_print(f"Fetching page over HTTP: {url}")
+            response = self._http.get(url, timeout=30)
+            content = response.content
+            if (response.ok and _SHOWN_SECTION_MARKER in content
+                    and _HIDDEN_SECTION_MARKER not in content):
+                self._debug_print("HTTP response contains expanded article sections")
+                return content
+            self._debug_print(f"HTTP response unusable (status {response.status_code}), using browser")
+        except requests.RequestException as e:
+            self._debug_print(f"HTTP fetch failed, using browser: {e}")
+        return None
+    
+    def fetch_all(self, urls, concurrency=_DEFAULT_FETCH_CONCURRENCY):
+        """
+        Fetch several article pages concurrently over the HTTP session
+        
+        Pages are streamed back in URL order through a window of at most
+        concurrency requests, so only that many responses are held at once
+        and the site never sees more than that in flight.
+        
+        Args:
+            urls (list): Article URLs
+            concurrency (int): Maximum number of requests in flight (at least 1)
+            
+        Returns:
+            iterator: (url, html) tuples, html being None for pages that need
+                the browser
+        """
+        # Checked here rather than in the generator, so a bad value fails at
+        # the call instead of on the first page
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        return self._iter_fetch_all(urls, concurrency)
+    
+    def _iter_fetch_all(self, urls, concurrency):
+        """Generator behind fetch_all"""
+        if not self._http:
+            for url in urls:
+                yield url, None
+            return
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            window = deque()
+            for url in urls:
+                window.append((url, executor.submit(self._fetch_html_http, url)))
+                if len(window) >= concurrency:
+                    url, future = window.popleft()
+                    yield url, future.result()
+            
+            while window:
+                url, future = window.popleft()
+                yield url, future.result()
+    
+    def _fetch_html_browser(self, url):
+        """Load a page in Selenium, expand its content and return the page source"""
+        self._debug_print(f"Loading page: {url}")
+        self.driver.get(url)
+        
+        # Wait for page load
+        WebDriverWait(self.driver, 10).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        
+        # Add debugging to see what's on the page
+        if self.debug:
+            self._debug_page_structure()
+        
+        # Expand content
+        self.expand_content()
+        
+        # Debug dumps want the whole document; extraction only needs the sections
+        if self.debug:
+            return self.driver.page_source
+        return self.driver.execute_script(_ARTICLE_HTML_JS)
+    
     def _debug_page_structure(self):
         """Debug the page structure to understand what elements are available"""
         try:
-            # Check for main content areas
-            main_selectors = [
-                'article[data-e2e-test-id="learningCardContent"]',
-                'article',
-                'main',
-                '[data-e2e-test-id*="content"]',
-                '[data-e2e-test-id*="article"]',
-                '[data-e2e-test-id*="learning"]'
-            ]
-            
-            for selector in main_selectors:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    self._debug_print(f"Found {len(elements)} elements with selector: {selector}")
-                    
-                    # If it's the learning card, get more details
-                    if 'learningCardContent' in selector and elements:
-                        element = elements[0]
-                        # Look for sections
-                        sections = element.find_elements(By.CSS_SELECTOR, '[data-e2e-test-id="section-with-header"]')
-                        self._debug_print(f"Found {len(sections)} sections in learningCardContent")
-                        
-                        # Look for any content containers
-                        content_containers = element.find_elements(By.CSS_SELECTOR, '[data-e2e-test-id*="section-content"]')
-                        self._debug_print(f"Found {len(content_containers)} content containers")
+            # Check for main content areas (one round trip for all selectors)
+            main_counts = self.driver.execute_script(_COUNT_SELECTORS_JS, _DEBUG_MAIN_SELECTORS)
+            for selector, count in zip(_DEBUG_MAIN_SELECTORS, main_counts):
+                if count:
+                    self._debug_print(f"Found {count} elements with selector: {selector}")
+            
+            # If there is a learning card, get more details
+            if main_counts[0]:
+                sections, content_containers = self.driver.execute_script(
+                    _COUNT_SELECTORS_JS, _DEBUG_LEARNING_CARD_SELECTORS, _DEBUG_MAIN_SELECTORS[0]
+                )
+                self._debug_print(f"Found {sections} sections in learningCardContent")
+                self._debug_print(f"Found {content_containers} content containers")
             
             # Check for toggle buttons
-            toggle_selectors = [
-                '[data-e2e-test-id*="toggle"]',
-                'button[aria-label*="expand"]',
-                'button[aria-label*="collapse"]',
-                'button[aria-expanded]'
-            ]
-            
-            for selector in toggle_selectors:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    self._debug_print(f"Found {len(elements)} potential toggle elements: {selector}")
+            toggle_counts = self.driver.execute_script(_COUNT_SELECTORS_JS, _DEBUG_TOGGLE_SELECTORS)
+            for selector, count in zip(_DEBUG_TOGGLE_SELECTORS, toggle_counts):
+                if count:
+                    self._debug_print(f"Found {count} potential toggle elements: {selector}")
             
             # Check page title
             title = self.driver.title
@@ -1383,20 +1833,39 @@ class AmbossScraper:
         except Exception as e:
             self._debug_print(f"Error debugging page structure: {e}")
     
-    def scrape_multiple_urls(self, urls, output_format='text', output_dir=None, delay_range=(1, 3)):
+    def scrape_multiple_urls(self, urls, output_format='text', output_dir=None, delay_range=(1, 3),
+                             concurrency=_DEFAULT_FETCH_CONCURRENCY, parse_workers=4, parse_processes=0):
         """
         Scrape multiple URLs with rate limiting and session reuse
         
+        Pages are loaded one at a time on the main thread (the browser session
+        is not shared), while parsing and formatting run on a thread pool, or
+        on worker processes for large CPU-bound batches, so they overlap with
+        the next page load.
+        
         Args:
             urls (list): List of URLs to scrape
             output_format (str): Output format
             output_dir (str): Output directory
-            delay_range (tuple): Min/max delay between requests
+            delay_range (tuple): Min/max delay between browser page loads
+            concurrency (int): Parallel HTTP fetches for pages that need no
+                browser (at least 1)
+            parse_workers (int): Threads parsing and formatting loaded pages
+            parse_processes (int): Worker processes to parse in instead of
+                threads (0 keeps parsing in this process)
             
         Returns:
-            dict: Results for each URL
+            dict: 'results' (URL -> content or error message), 'outcomes'
+                ((url, success) per input entry, in input order, duplicates
+                included) and the 'successful' / 'failed' counts
         """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        
         results = {}
+        # (index, url, success) per entry as it completes, sorted at the end
+        outcomes = []
+        batch = {'results': results, 'outcomes': [], 'successful': 0, 'failed': 0}
         successful = 0
         failed = 0
         
@@ -1404,68 +1873,165 @@ class AmbossScraper:
             os.makedirs(output_dir)
             print(f"Created output directory: {output_dir}")
         
+        # HTML pages saved together share one stylesheet instead of each
+        # embedding a copy
+        standalone = not (output_dir and output_format == 'html')
+        if not standalone:
+            _write_text_file(os.path.join(output_dir, _HTML_STYLESHEET_NAME), _HTML_CSS)
+        
         print(f"Starting to scrape {len(urls)} pages...")
         print(f"Delay range: {delay_range[0]}-{delay_range[1]} seconds")
         
         # Setup driver and login once for all URLs
         web_urls = [url for url in urls if url.startswith(('http://', 'https://'))]
         if web_urls:
-            print("Setting up browser session...")
-            if not self.setup_driver():
-                print("ERROR: Could not setup browser session")
-                return results
+            if not self.driver:
+                print("Setting up browser session...")
+                if not self.setup_driver():
+                    print("ERROR: Could not setup browser session")
+                    return batch
             
             # Login once if credentials provided
             if self.username and self.password:
                 print("Logging in...")
                 if not self.login():
                     print("ERROR: Login failed")
-                    return results
+                    return batch
                 print("✓ Login successful - will reuse session for all URLs")
         
+        # Fetch pages that don't need JavaScript expansion concurrently, a few
+        # ahead of the page being processed
+        prefetch = None
+        prefetched = 0
+        if web_urls and self._http:
+            print(f"Prefetching pages over HTTP ({concurrency} parallel)...")
+            prefetch = self.fetch_all(web_urls, concurrency)
+        
         print("=" * 50)
         
-        for i, url in enumerate(urls, 1):
-            print(f"[{i}/{len(urls)}] Scraping: {url}")
-            
+        # (index, url, future, fetched over HTTP) of pages handed to the parse
+        # pool, in URL order
+        pending = deque()
+        
+        def pause():
+            """Wait a random delay_range interval before a browser page load"""
+            delay = random.uniform(delay_range[0], delay_range[1])
+            print(f"  Waiting {delay:.1f} seconds...")
+            time.sleep(delay)
+        
+        def finish(i, url, future, from_http=False):
+            """Record and save one parsed page; True on success"""
+            nonlocal prefetched
             try:
-                # Add delay between requests
-                if i > 1:
-                    delay = random.uniform(delay_range[0], delay_range[1])
-                    print(f"  Waiting {delay:.1f} seconds...")
-                    time.sleep(delay)
-                
-                # Scrape the page (skip login since we already did it)
-                content, article_title = self.scrape_url_batch(url, output_format)
-                results[url] = content
+                content, article_title = future.result()
+                if from_http and content == _NO_CONTENT_MESSAGE:
+                    # The static page had no usable sections; expand it in the browser
+                    self._debug_print(f"No sections in HTTP response for {url}, using browser")
+                    prefetched -= 1
+                    pause()
+                    html_content = self._fetch_batch_html(url, http_tried=True)
+                    if html_content is None:
+                        raise RuntimeError("Browser session not available")
+                    content, article_title = self.parse_and_format(html_content, output_format, standalone)
+            except Exception as e:
+                content, article_title = f"Error scraping {url}: {str(e)}", None
+                self._debug_print(content)
+            ok = bool(content) and not content.startswith("Error")
+            
+            # Save to file if directory specified; a page that cannot be saved
+            # fails on its own instead of ending the batch
+            saved_as = None
+            if ok and output_dir:
+                try:
+                    saved_as = self.generate_filename(url, i, output_format, article_title)
+                    _write_text_file(os.path.join(output_dir, saved_as), content)
+                except Exception as e:
+                    content, ok = f"Error saving {url}: {str(e)}", False
+            
+            results[url] = content
+            outcomes.append((i, url, ok))
+            
+            if ok:
+                if saved_as:
+                    print(f"  ✓ [{i}/{len(urls)}] Saved to {saved_as}")
+                else:
+                    print(f"  ✓ [{i}/{len(urls)}] Successfully scraped")
+                return True
+            
+            print(f"  ✗ [{i}/{len(urls)}] Failed: {content}")
+            return False
+        
+        # Worker processes get their own scraper, so they are handed module-level
+        # functions rather than methods bound to this one (and its browser)
+        if parse_processes:
+            pool = ProcessPoolExecutor(max_workers=parse_processes, initializer=_init_parse_worker,
+                                       initargs=(self.debug,))
+            parse_page, parse_local_file = _parse_and_format_in_worker, _scrape_local_file_in_worker
+        else:
+            pool = ThreadPoolExecutor(max_workers=parse_workers)
+            parse_page, parse_local_file = self.parse_and_format, self.scrape_local_file
+        
+        with pool:
+            for i, url in enumerate(urls, 1):
+                print(f"[{i}/{len(urls)}] Scraping: {url}")
                 
-                if content and not content.startswith("Error"):
-                    successful += 1
+                try:
+                    # Local files have nothing to load; read and parse them in the pool
+                    if not url.startswith(('http://', 'https://')):
+                        pending.append((i, url, pool.submit(parse_local_file, url, output_format, standalone)))
+                        continue
                     
-                    # Save to file if directory specified
-                    if output_dir:
-                        filename = self.generate_filename(url, i, output_format, article_title)
-                        filepath = os.path.join(output_dir, filename)
-                        
-                        with open(filepath, 'w', encoding='utf-8') as f:
-                            f.write(content)
-                        print(f"  ✓ Saved to {filename}")
+                    # Take this page from the prefetch, which yields in URL order
+                    html_content = next(prefetch)[1] if prefetch is not None else None
+                    if html_content is not None:
+                        prefetched += 1
+                    
+                    # Add delay between requests (prefetched pages need no new request)
+                    elif i > 1:
+                        pause()
+                    
+                    # Load the page (skip login since we already did it)
+                    from_http = html_content is not None
+                    html_content = self._fetch_batch_html(url, html_content, http_tried=prefetch is not None)
+                    if html_content is None:
+                        raise RuntimeError("Browser session not available")
+                    
+                    pending.append((i, url, pool.submit(parse_page, html_content, output_format, standalone),
+                                    from_http))
+                    
+                except Exception as e:
+                    failed += 1
+                    error_msg = f"Error: {str(e)}"
+                    print(f"  ✗ Failed: {error_msg}")
+                    results[url] = error_msg
+                    outcomes.append((i, url, False))
+                
+                # Save pages whose parsing already finished, keeping URL order
+                while pending and pending[0][2].done():
+                    if finish(*pending.popleft()):
+                        successful += 1
                     else:
-                        print(f"  ✓ Successfully scraped")
+                        failed += 1
+            
+            # Wait for the pages still being parsed
+            while pending:
+                if finish(*pending.popleft()):
+                    successful += 1
                 else:
                     failed += 1
-                    print(f"  ✗ Failed: {content}")
-                
-            except Exception as e:
-                failed += 1
-                error_msg = f"Error: {str(e)}"
-                print(f"  ✗ Failed: {error_msg}")
-                results[url] = error_msg
+        
+        if prefetch is not None:
+            prefetch.close()
+            print(f"✓ Fetched {prefetched}/{len(web_urls)} pages without the browser")
         
         print("=" * 50)
         print(f"Scraping completed! Success: {successful}, Failed: {failed}")
         
-        return results
+        outcomes.sort()
+        batch['outcomes'] = [(url, ok) for _, url, ok in outcomes]
+        batch['successful'] = successful
+        batch['failed'] = failed
+        return batch
     
 
     
@@ -1489,64 +2055,74 @@ class AmbossScraper:
                     headers.append(header_text if header_text else " ")
                 
                 if headers:
-                    rows.append("| " + " | ".join(headers) + " |")
-                    rows.append("| " + " | ".join(["---"] * len(headers)) + " |")
+                    rows.append(f"| {' | '.join(headers)} |")
+                    rows.append(f"| {' | '.join(['---'] * len(headers))} |")
         
-        # Process body
-        tbody = table.find('tbody') or table
-        for tr in tbody.find_all('tr'):
-            if tr.find_parent('thead'):  # Skip header rows
-                continue
-                
-            cells = []
-            for td in tr.find_all(['td', 'th']):
-                # Process cell content with proper formatting
-                cell_content = self.format_table_cell(td)
-                cells.append(cell_content)
+        # Process body. Header rows are filtered out once while selecting the
+        # rows, and only when there is no tbody to take them from
+        tbody = table.find('tbody')
+        if tbody:
+            body_rows = tbody.find_all('tr')
+        else:
+            body_rows = [tr for tr in table.find_all('tr') if tr.parent.name != 'thead']
+        
+        # Bound once for the row loop; each row is a single f-string
+        rows_append = rows.append
+        format_cell = self.format_table_cell
+        for tr in body_rows:
+            # Process cell content with proper formatting
+            cells = [format_cell(td) for td in _child_tags(tr, ('td', 'th'))]
             
             if cells:
-                rows.append("| " + " | ".join(cells) + " |")
+                rows_append(f"| {' | '.join(cells)} |")
         
         return "\n".join(rows) if rows else ""
     
     def format_table_cell(self, cell):
         """Format table cell content with proper text extraction"""
-        cell_parts = []
-        
-        # Process all elements in the cell
-        for element in cell.descendants:
-            if hasattr(element, 'name'):
-                if element.name == 'br':
-                    cell_parts.append('<br/>')
-                elif element.name in ['ul', 'ol']:
-                    # Handle lists in table cells
-                    for li in element.find_all('li', recursive=False):
-                        li_text = self.clean_text(li.get_text())
-                        if li_text:
-                            # Check nesting level
-                            parent_lists = len(li.find_parents(['ul', 'ol']))
-                            if parent_lists > 1:
-                                cell_parts.append(f"&nbsp;&nbsp;&nbsp;&nbsp;◦ {li_text}")
-                            else:
-                                cell_parts.append(f"• {li_text}")
-                elif element.name in ['strong', 'b']:
-                    text = self.clean_text(element.get_text())
-                    if text and text not in ' '.join(cell_parts):
-                        cell_parts.append(f"**{text}**")
-                elif element.name in ['em', 'i']:
-                    text = self.clean_text(element.get_text())
-                    if text and text not in ' '.join(cell_parts):
-                        cell_parts.append(f"*{text}*")
-            elif isinstance(element, str):
-                text = self.clean_text(element)
-                if text and text not in ' '.join(cell_parts):
-                    cell_parts.append(text)
-        
-        # Join and clean up
-        cell_text = ' '.join(cell_parts).strip()
+        # Fast path for plain cells (most of them): nothing needs formatting, so
+        # the cell is just its text from a single get_text() call
+        if cell.find(_CELL_FORMATTED_TAGS) is None:
+            return self.clean_text(cell.get_text()).replace('|', '\\|')
+        
+        parts = []
+        clean = self.clean_text
+        # Lists around the cell itself count toward item nesting
+        outer_lists = len(cell.find_parents(['ul', 'ol']))
+        
+        # Walk the cell once in document order with a stack of (node, lists
+        # in the cell enclosing it, handlers that apply). Bold/italic text and
+        # list items are emitted whole, so below them only nested lists and
+        # line breaks are handled and their text runs are not extracted again.
+        # Other text is emitted as it is reached, like the plain-cell path does
+        stack = [(child, 0, _CELL_TAG_HANDLERS)
+                 for child in reversed(cell.contents)]
+        while stack:
+            element, in_lists, handlers = stack.pop()
+            name = element.name
+            if name is None:
+                # Comments and other special strings are not cell text
+                if handlers is _CELL_TAG_HANDLERS and type(element) is NavigableString:
+                    text = clean(element)
+                    if text:
+                        parts.append(text)
+                continue
+            handler = handlers.get(name)
+            if handler:
+                fragment = handler(element, outer_lists + in_lists, clean)
+                if fragment:
+                    parts.append(fragment)
+                if name == 'ul' or name == 'ol':
+                    in_lists += 1
+                handlers = _CELL_NESTED_TAG_HANDLERS
+            stack.extend((child, in_lists, handlers)
+                         for child in reversed(element.contents))
+        
+        cell_text = ' '.join(parts)
+        cell_text = cell_text.strip()
         
         # Clean up extra spaces and duplicates
-        cell_text = re.sub(r'\s+', ' ', cell_text)
+        cell_text = _WS_RE.sub(' ', cell_text)
         cell_text = cell_text.replace('|', '\\|')  # Escape pipes
         
         return cell_text if cell_text else ""
@@ -1558,28 +2134,40 @@ class AmbossScraper:
         # First try: Extract from HTML title tag
         title_tag = soup.find('title')
         if title_tag:
-            title_text = title_tag.get_text().strip()
+            title_text = self._fast_text(title_tag).strip()
             # Remove " - AMBOSS" suffix if present
-            if title_text.endswith(' - AMBOSS'):
-                title_text = title_text[:-9].strip()
+            if title_text.endswith(_AMBOSS_TITLE_SUFFIX):
+                title_text = title_text[:-len(_AMBOSS_TITLE_SUFFIX)].strip()
             if title_text:
                 return title_text
         
         # Second try: Find article header element
         article_header = soup.find(attrs={'data-e2e-test-id': 'articleHeader'})
         if article_header:
-            title_element = (
-                article_header.find('h1') or 
-                article_header.find('h2') or 
-                article_header.find(class_=lambda x: x and 'title' in x.lower())
-            )
+            # Prefer the first h1, then the first h2, then the first element
+            # with a title-like class, found in a single walk over the header
+            title_element = first_h2 = first_titled = None
+            for element in article_header.descendants:
+                name = element.name
+                if name == 'h1':
+                    title_element = element
+                    break
+                if name == 'h2' and first_h2 is None:
+                    first_h2 = element
+                if name and first_titled is None and any(
+                    _TITLE_CLS_RE.search(cls) for cls in element.get('class') or ()
+                ):
+                    first_titled = element
+            else:
+                title_element = first_h2 or first_titled
+            
             if title_element:
-                return self.clean_text(title_element.get_text())
+                return self.clean_text(self._fast_text(title_element))
         
         # Third try: Look for main heading in content
         main_heading = soup.find('h1')
         if main_heading:
-            title = self.clean_text(main_heading.get_text())
+            title = self.clean_text(self._fast_text(main_heading))
             if title:
                 return title
         
@@ -1587,6 +2175,45 @@ class AmbossScraper:
         return "Medical Content"
 
 
+def _write_text_file(filepath, content):
+    """
+    Write content to filepath as UTF-8 with a single os.write where possible
+    
+    Skips the text stream layer for the one-shot writes of batch exports.
+    Newlines are translated like text mode would on this platform.
+    """
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    data = memoryview(content.encode('utf-8'))
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        # os.write may write less than asked for
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+# Scraper used for parsing inside a parse worker process, set by _init_parse_worker
+_worker_scraper = None
+
+
+def _init_parse_worker(debug):
+    """Create the parse worker process's scraper; it never opens a browser"""
+    global _worker_scraper
+    _worker_scraper = AmbossScraper(debug=debug)
+
+
+def _parse_and_format_in_worker(html_content, output_format, standalone):
+    """AmbossScraper.parse_and_format, run in a parse worker process"""
+    return _worker_scraper.parse_and_format(html_content, output_format, standalone)
+
+
+def _scrape_local_file_in_worker(filepath, output_format, standalone):
+    """AmbossScraper.scrape_local_file, run in a parse worker process"""
+    return _worker_scraper.scrape_local_file(filepath, output_format, standalone)
+
+
 def read_urls_from_file(filename):
     """Read URLs from a text file"""
     urls = []
@@ -1652,6 +2279,12 @@ Examples:
     parser.add_argument('--delay', type=float, nargs=2, default=[1, 3], 
                        metavar=('MIN', 'MAX'),
                        help='Delay range between requests in seconds (default: 1 3)')
+    parser.add_argument('--workers', type=int, default=_DEFAULT_FETCH_CONCURRENCY,
+                       help=f'Parallel HTTP fetches in batch mode (default: {_DEFAULT_FETCH_CONCURRENCY})')
+    parser.add_argument('--parse-processes', type=int, nargs='?', default=0,
+                       const=os.cpu_count() or 1, metavar='N',
+                       help='Parse pages in N worker processes in batch mode '
+                            '(default: 0, parse on threads; N defaults to the CPU count)')
     parser.add_argument('--debug', action='store_true', 
                        help='Enable debug output and save debug files')
     
@@ -1660,6 +2293,8 @@ Examples:
     # Validate arguments
     if args.url is None and args.urls_file is None:
         parser.error('Either provide a URL or use --urls-file')
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
     
     # Initialize scraper
     scraper = AmbossScraper(
@@ -1678,28 +2313,33 @@ Examples:
             
             output_dir = args.output or 'amboss_content'
             
-            results = scraper.scrape_multiple_urls(
+            batch = scraper.scrape_multiple_urls(
                 urls,
                 output_format=args.format,
                 output_dir=output_dir,
-                delay_range=tuple(args.delay)
+                delay_range=tuple(args.delay),
+                concurrency=args.workers,
+                parse_processes=args.parse_processes
             )
             
             # Save summary
             summary_file = os.path.join(output_dir, f'_summary_{args.format}.txt')
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                f.write("AMBOSS Scraping Summary\n")
-                f.write("=====================\n")
-                f.write(f"Total URLs: {len(urls)}\n")
-                f.write(f"Successful: {sum(1 for r in results.values() if not r.startswith('Error'))}\n")
-                f.write(f"Failed: {sum(1 for r in results.values() if r.startswith('Error'))}\n")
-                f.write(f"Format: {args.format}\n\n")
-                
-                f.write("Results:\n")
-                f.write("-" * 50 + "\n")
-                for url, result in results.items():
-                    status = "✓" if not result.startswith('Error') else "✗"
-                    f.write(f"{status} {url}\n")
+            # Build the summary in memory (counts come from the batch itself)
+            # and write it in one go
+            result_lines = [f"{'✓' if ok else '✗'} {url}\n" for url, ok in batch['outcomes']]
+            
+            summary_header = (
+                "AMBOSS Scraping Summary\n"
+                "=====================\n"
+                f"Total URLs: {len(urls)}\n"
+                f"Successful: {batch['successful']}\n"
+                f"Failed: {batch['failed']}\n"
+                f"Format: {args.format}\n\n"
+                "Results:\n"
+                + "-" * 50 + "\n"
+            )
+            with open(summary_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(summary_header + ''.join(result_lines))
             
             print(f"Summary saved to {summary_file}")
         
@@ -1708,7 +2348,7 @@ Examples:
             content, article_title = scraper.scrape_url(args.url, args.format)
             
             if args.output:
-                with open(args.output, 'w', encoding='utf-8') as f:
+                with open(args.output, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
                     f.write(content)
                 print(f"Content saved to {args.output}")
             else: